@@ -5,12 +5,14 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+import copy
 import os
 from pathlib import Path
 
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.staticfiles import StaticFiles
+from fastapi.responses import RedirectResponse
+
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
 
@@ -19,64 +21,72 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
-activities  = {
+# Seed data for the in-memory activity database
+INITIAL_ACTIVITIES = {
     "Basketball Team": {
         "description": "Join the basketball team and compete in local tournaments",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     },
     "Soccer Club": {
         "description": "Practice soccer skills and participate in matches",
         "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
         "max_participants": 20,
-        "participants": []
+        "participants": set()
     },
     "Art Club": {
         "description": "Explore various art techniques and create projects",
         "schedule": "Fridays, 3:00 PM - 5:00 PM",
         "max_participants": 10,
-        "participants": []
+        "participants": set()
     },
     "Drama Club": {
         "description": "Participate in theater productions and improve acting skills",
         "schedule": "Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 20,
-        "participants": []
+        "participants": set()
     },
     "Debate Team": {
         "description": "Engage in debates and improve public speaking skills",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": []
+        "participants": set()
     },
     "Math Club": {
         "description": "Solve challenging math problems and participate in competitions",
         "schedule": "Tuesdays, 3:00 PM - 4:30 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
+# In-memory activity database
+activities = copy.deepcopy(INITIAL_ACTIVITIES)
+
+
+def get_activities_store():
+    """Dependency returning the activity database used by the routes"""
+    return activities
+
 
 @app.get("/")
 def root():
@@ -84,40 +94,45 @@ def root():
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities(store: dict = Depends(get_activities_store)) -> dict[str, dict]:
+    # Participants are stored as sets; hand them out as stable, sorted lists
+    return {
+        name: {**activity, "participants": sorted(activity["participants"])}
+        for name, activity in store.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
 # Validate student is not already signed up
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str,
+                        store: dict = Depends(get_activities_store)):
     """Sign up a student for an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    activity = store.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Check if student is already signed up
-    activity = activities[activity_name]
-    if email in activity["participants"]:
+    participants = activity["participants"]
+    if email in participants:
         raise HTTPException(status_code=400, detail="Student is already signed up for this activity")
 
-    # Get the specific activity
-    activity = activities[activity_name]
-
     # Add student
-    activity["participants"].append(email)
+    participants.add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.post("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str,
+                             store: dict = Depends(get_activities_store)):
     """Unregister a student from an activity"""
-    if activity_name not in activities:
+    activity = store.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    activity = activities[activity_name]
-    if email not in activity["participants"]:
+    participants = activity["participants"]
+    if email not in participants:
         raise HTTPException(status_code=400, detail="Student is not registered for this activity")
 
-    activity["participants"].remove(email)
+    participants.remove(email)
     return {"message": f"Unregistered {email} from {activity_name}"}
@@ -0,0 +1,79 @@
+"""
+Shared pytest fixtures for the Mergington High School API tests
+"""
+import copy
+import importlib.util
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from uuid import uuid4
+
+from app import INITIAL_ACTIVITIES, app, get_activities, get_activities_store
+
+HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+
+@pytest.fixture(scope="session")
+def client():
+    """A single TestClient shared by the whole test session
+
+    Entering the client once keeps one event loop portal open for every
+    request; the app has no startup handlers, so lifespan itself is free.
+    uvloop is used when installed (it isn't on Windows or PyPy).
+    """
+    backend_options = {"use_uvloop": True} if HAS_UVLOOP else {}
+    with TestClient(app, backend="asyncio",
+                    backend_options=backend_options) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """A single async client shared by the whole test session"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport,
+                                 base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def activities_store():
+    """Give each test its own copy of the activity database
+
+    This keeps mutating tests independent of each other so the suite can
+    be sharded with ``pytest -n auto``.
+    """
+    store = copy.deepcopy(INITIAL_ACTIVITIES)
+    app.dependency_overrides[get_activities_store] = lambda: store
+    yield store
+    app.dependency_overrides.pop(get_activities_store, None)
+
+
+@pytest.fixture
+def activities(client):
+    """The parsed GET /activities payload, fetched once per test"""
+    return orjson.loads(client.get("/activities").content)
+
+
+@pytest.fixture
+def handler_activities(activities_store):
+    """The GET /activities handler's return value, called without HTTP
+
+    For data-shape assertions that don't need routing or JSON encoding.
+    """
+    return get_activities(activities_store)
+
+
+@pytest.fixture
+def unique_email():
+    """An email address no other test (or re-run) will sign up with"""
+    return f"test_{uuid4().hex[:8]}@mergington.edu"
+
+
+@pytest.fixture
+def seeded_participant(activities_store, unique_email):
+    """An email already registered for Debate Team, added without HTTP"""
+    activities_store["Debate Team"]["participants"].add(unique_email)
+    return unique_email
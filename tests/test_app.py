@@ -1,105 +1,109 @@
 """
 Test suite for the Mergington High School API
 """
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path to import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import INITIAL_ACTIVITIES
 
-from app import app
+# Activity names are static, so they can drive parametrization at collection
+ACTIVITY_NAMES = list(INITIAL_ACTIVITIES)
 
-# Create test client
-client = TestClient(app)
+EXPECTED_ACTIVITIES = frozenset({
+    "Basketball Team",
+    "Soccer Club",
+    "Art Club",
+    "Drama Club",
+    "Debate Team",
+    "Math Club",
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+})
+
+REQUIRED_FIELDS = frozenset({"description", "schedule", "max_participants", "participants"})
+
+REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+
+
+def as_json(response):
+    """Decode a response body with orjson rather than stdlib json"""
+    return orjson.loads(response.content)
 
 
 class TestActivitiesEndpoint:
     """Tests for the /activities endpoint"""
     
-    def test_get_activities_returns_200(self):
+    def test_get_activities_returns_200(self, client):
         """Test that GET /activities returns 200 status"""
         response = client.get("/activities")
         assert response.status_code == 200
     
-    def test_get_activities_returns_dict(self):
+    def test_get_activities_returns_dict(self, client):
         """Test that GET /activities returns a dictionary"""
         response = client.get("/activities")
-        assert isinstance(response.json(), dict)
+        assert isinstance(as_json(response), dict)
     
-    def test_get_activities_contains_expected_activities(self):
+    def test_get_activities_contains_expected_activities(self, activities):
         """Test that all expected activities are present"""
-        response = client.get("/activities")
-        activities = response.json()
-        expected = [
-            "Basketball Team",
-            "Soccer Club",
-            "Art Club",
-            "Drama Club",
-            "Debate Team",
-            "Math Club",
-            "Chess Club",
-            "Programming Class",
-            "Gym Class"
-        ]
-        for activity in expected:
-            assert activity in activities
-    
-    def test_activity_has_required_fields(self):
+        missing = EXPECTED_ACTIVITIES - activities.keys()
+        assert not missing, f"missing: {missing}"
+    
+    @pytest.mark.parametrize("activity_name", ACTIVITY_NAMES)
+    def test_activity_has_required_fields(self, handler_activities, activity_name):
         """Test that each activity has required fields"""
-        response = client.get("/activities")
-        activities = response.json()
-        required_fields = ["description", "schedule", "max_participants", "participants"]
-        
-        for activity_name, activity_data in activities.items():
-            for field in required_fields:
-                assert field in activity_data, f"{activity_name} missing field {field}"
+        missing = REQUIRED_FIELDS - handler_activities[activity_name].keys()
+        assert not missing, f"{activity_name} missing fields {missing}"
     
-    def test_participants_is_list(self):
+    @pytest.mark.parametrize("activity_name", ACTIVITY_NAMES)
+    def test_participants_is_list(self, activities, activity_name):
         """Test that participants field is always a list"""
-        response = client.get("/activities")
-        activities = response.json()
-        for activity_name, activity_data in activities.items():
-            assert isinstance(activity_data["participants"], list)
+        assert isinstance(activities[activity_name]["participants"], list)
+    
+    @pytest.mark.parametrize("activity_name", ACTIVITY_NAMES)
+    def test_participants_are_sorted(self, activities, activity_name):
+        """Test that participants are returned in sorted order"""
+        participants = activities[activity_name]["participants"]
+        assert participants == sorted(participants)
 
 
 class TestSignupEndpoint:
     """Tests for the /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_with_valid_activity_and_email(self):
+    def test_signup_with_valid_activity_and_email(self, client, unique_email):
         """Test successful signup"""
         response = client.post(
-            "/activities/Basketball Team/signup?email=student@mergington.edu"
+            f"/activities/Basketball Team/signup?email={unique_email}"
         )
         assert response.status_code == 200
-        data = response.json()
+        data = as_json(response)
         assert "message" in data
-        assert "student@mergington.edu" in data["message"]
+        assert unique_email in data["message"]
     
-    def test_signup_adds_participant_to_activity(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_signup_adds_participant_to_activity(self, aclient, unique_email):
         """Test that signup actually adds participant to activity"""
-        email = "test_signup@mergington.edu"
-        response = client.post(
+        email = unique_email
+        response = await aclient.post(
             f"/activities/Soccer Club/signup?email={email}"
         )
         assert response.status_code == 200
         
         # Verify participant was added
-        activities = client.get("/activities").json()
+        activities = as_json(await aclient.get("/activities"))
         assert email in activities["Soccer Club"]["participants"]
     
-    def test_signup_nonexistent_activity_returns_404(self):
+    def test_signup_nonexistent_activity_returns_404(self, client, unique_email):
         """Test signup for non-existent activity returns 404"""
         response = client.post(
-            "/activities/Nonexistent Club/signup?email=student@mergington.edu"
+            f"/activities/Nonexistent Club/signup?email={unique_email}"
         )
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
+        assert "not found" in as_json(response)["detail"].lower()
     
-    def test_duplicate_signup_returns_400(self):
+    def test_duplicate_signup_returns_400(self, client, unique_email):
         """Test that duplicate signup returns 400 error"""
-        email = "duplicate@mergington.edu"
+        email = unique_email
         
         # First signup should succeed
         response1 = client.post(
@@ -112,15 +116,15 @@ class TestSignupEndpoint:
             f"/activities/Art Club/signup?email={email}"
         )
         assert response2.status_code == 400
-        assert "already signed up" in response2.json()["detail"].lower()
+        assert "already signed up" in as_json(response2)["detail"].lower()
     
-    def test_signup_response_format(self):
+    def test_signup_response_format(self, client, unique_email):
         """Test that signup response has correct format"""
         response = client.post(
-            "/activities/Drama Club/signup?email=drama@mergington.edu"
+            f"/activities/Drama Club/signup?email={unique_email}"
         )
         assert response.status_code == 200
-        data = response.json()
+        data = as_json(response)
         assert isinstance(data, dict)
         assert "message" in data
 
@@ -128,55 +132,43 @@ class TestSignupEndpoint:
 class TestUnregisterEndpoint:
     """Tests for the /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_removes_participant(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_unregister_removes_participant(self, aclient, seeded_participant):
         """Test that unregister removes a participant"""
-        email = "to_remove@mergington.edu"
-        
-        # Sign up first
-        client.post(f"/activities/Debate Team/signup?email={email}")
-        
-        # Verify participant was added
-        activities = client.get("/activities").json()
-        assert email in activities["Debate Team"]["participants"]
+        email = seeded_participant
         
         # Unregister
-        response = client.post(
+        response = await aclient.post(
             f"/activities/Debate Team/unregister?email={email}"
         )
         assert response.status_code == 200
         
         # Verify participant was removed
-        activities = client.get("/activities").json()
+        activities = as_json(await aclient.get("/activities"))
         assert email not in activities["Debate Team"]["participants"]
     
-    def test_unregister_nonexistent_activity_returns_404(self):
+    def test_unregister_nonexistent_activity_returns_404(self, client, unique_email):
         """Test unregister for non-existent activity returns 404"""
         response = client.post(
-            "/activities/Nonexistent Club/unregister?email=student@mergington.edu"
+            f"/activities/Nonexistent Club/unregister?email={unique_email}"
         )
         assert response.status_code == 404
     
-    def test_unregister_non_registered_student_returns_400(self):
+    def test_unregister_non_registered_student_returns_400(self, client, unique_email):
         """Test unregister for student not registered returns 400"""
         response = client.post(
-            "/activities/Chess Club/unregister?email=notregistered@mergington.edu"
+            f"/activities/Chess Club/unregister?email={unique_email}"
         )
         assert response.status_code == 400
-        assert "not registered" in response.json()["detail"].lower()
+        assert "not registered" in as_json(response)["detail"].lower()
     
-    def test_unregister_response_format(self):
+    def test_unregister_response_format(self, client, seeded_participant):
         """Test that unregister response has correct format"""
-        email = "unreg@mergington.edu"
-        
-        # Sign up first
-        client.post(f"/activities/Math Club/signup?email={email}")
-        
-        # Unregister
         response = client.post(
-            f"/activities/Math Club/unregister?email={email}"
+            f"/activities/Debate Team/unregister?email={seeded_participant}"
         )
         assert response.status_code == 200
-        data = response.json()
+        data = as_json(response)
         assert isinstance(data, dict)
         assert "message" in data
 
@@ -184,33 +176,22 @@ class TestUnregisterEndpoint:
 class TestRootEndpoint:
     """Tests for the root endpoint"""
     
-    def test_root_redirects(self):
+    def test_root_redirects(self, client):
         """Test that root redirects to static/index.html"""
         response = client.get("/", follow_redirects=False)
-        assert response.status_code in [301, 302, 303, 307, 308]
-        assert "/static" in response.headers.get("location", "").lower()
+        assert response.status_code in REDIRECT_CODES
+        assert response.headers.get("location", "").lower().startswith("/static")
 
 
 class TestDataIntegrity:
     """Tests to ensure data integrity across operations"""
     
-    def test_max_participants_respected(self):
+    def test_max_participants_respected(self, handler_activities):
         """Test that max_participants values are consistent"""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        for activity_name, activity_data in activities.items():
-            max_participants = activity_data["max_participants"]
-            participants = activity_data["participants"]
-            # Participants should not exceed max_participants
-            assert len(participants) <= max_participants
-    
-    def test_no_duplicate_participants(self):
-        """Test that no duplicates exist in participants list"""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        for activity_name, activity_data in activities.items():
-            participants = activity_data["participants"]
-            assert len(participants) == len(set(participants)), \
-                f"Duplicate participants in {activity_name}"
+        # Participants should not exceed max_participants
+        over = {
+            name: (len(data["participants"]), data["max_participants"])
+            for name, data in handler_activities.items()
+            if len(data["participants"]) > data["max_participants"]
+        }
+        assert not over, f"Over capacity: {over}"